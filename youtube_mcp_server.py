@@ -1,26 +1,149 @@
 #!/usr/bin/env python3
 
 import os
+import sys
 import json
+import hashlib
+import time
+import random
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, NamedTuple
 
 from mcp.server.fastmcp import FastMCP
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # YouTube API configuration
 SCOPES = ['https://www.googleapis.com/auth/youtube.readonly']
 API_SERVICE_NAME = 'youtube'
 API_VERSION = 'v3'
 
+# Maximum number of API requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Retry settings for rate-limited and failed API requests
+MAX_REQUEST_ATTEMPTS = 5
+MAX_RETRY_DELAY = 30  # seconds
+RATE_LIMIT_COOLDOWN = 60 * 60  # 1 hour
+RATE_LIMIT_REASONS = (b'rateLimitExceeded', b'userRateLimitExceeded')
+
+# Number of threads running blocking API calls
+MAX_API_WORKERS = 10
+
+# Number of recent uploads tracked per channel
+MAX_VIDEOS_PER_CHANNEL = 10
+
+# Recent uploads are re-fetched in full after a day so edits and deletions show up
+RECENT_UPLOADS_CACHE_TTL = 24 * 60 * 60
+MAX_RECENT_UPLOADS_ENTRIES = 2000
+
+# How long cached API metadata stays fresh (in seconds)
+SUBSCRIPTIONS_CACHE_TTL = 12 * 60 * 60  # 12 hours
+
+# Recent video results are reused for half the requested window, capped at 5 minutes
+VIDEO_RESULTS_CACHE_TTL = 5 * 60
+
+# Watch URLs are built from video IDs when formatting output
+WATCH_URL_PREFIX = 'https://www.youtube.com/watch?v='
+
+# Separator between videos in tool responses
+VIDEO_SEPARATOR = "\n" + "-" * 50 + "\n\n"
+
+class VideoInfo(NamedTuple):
+    """Fields kept per video in the recent uploads cache"""
+    video_id: str
+    title: str
+    published_at: str
+    description: str
+    thumbnail: str
+
+@dataclass(slots=True)
+class VideoBatch:
+    """Videos stored as parallel lists, one index per video"""
+    video_ids: List[str] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    published_at: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    thumbnails: List[str] = field(default_factory=list)
+    channel_ids: List[str] = field(default_factory=list)
+    channel_titles: List[Optional[str]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.video_ids)
+    
+    def append(self, video: VideoInfo, channel_id: str, channel_title: Optional[str] = None):
+        """Add a video to the batch"""
+        self.video_ids.append(video.video_id)
+        self.titles.append(video.title)
+        self.published_at.append(video.published_at)
+        self.descriptions.append(video.description)
+        self.thumbnails.append(video.thumbnail)
+        self.channel_ids.append(channel_id)
+        self.channel_titles.append(channel_title)
+    
+    def extend(self, other: 'VideoBatch', channel_title: Optional[str] = None):
+        """Add all videos from another batch, tagged with a channel title"""
+        self.video_ids.extend(other.video_ids)
+        self.titles.extend(other.titles)
+        self.published_at.extend(other.published_at)
+        self.descriptions.extend(other.descriptions)
+        self.thumbnails.extend(other.thumbnails)
+        self.channel_ids.extend(other.channel_ids)
+        self.channel_titles.extend([channel_title] * len(other))
+    
+    def sort_newest_first(self):
+        """Sort all videos by published date, newest first"""
+        # publishedAt is ISO-8601 UTC, so string order is time order
+        order = sorted(range(len(self)), key=self.published_at.__getitem__, reverse=True)
+        for name in self.__slots__:
+            values = getattr(self, name)
+            setattr(self, name, [values[i] for i in order])
+    
+    def to_dicts(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Build video dicts for the first `limit` videos (all if not set)"""
+        count = min(limit, len(self)) if limit else len(self)
+        # Same order as VideoInfo._fields
+        columns = (self.video_ids, self.titles, self.published_at, self.descriptions, self.thumbnails)
+        videos = []
+        for i in range(count):
+            video_info = {name: column[i] for name, column in zip(VideoInfo._fields, columns)}
+            if self.channel_titles[i] is not None:
+                video_info['channel_id'] = self.channel_ids[i]
+                video_info['channel_title'] = self.channel_titles[i]
+            videos.append(video_info)
+        return videos
+
 class YouTubeClient:
-    def __init__(self, credentials_file='credentials.json', token_file='token.json'):
+    def __init__(self, credentials_file='credentials.json', token_file='token.json', cache_dir='~/.cache/yt-mcp'):
         self.credentials_file = credentials_file
         self.token_file = token_file
+        self.cache_dir = os.path.expanduser(cache_dir)
+        # Subscriptions belong to the account behind the token, so key their cache by token file
         self.youtube = None
+        self.creds = None
+        self._video_cache = None
+        self._video_cache_dirty = False
+        # Maps (channel ID or None for all subscriptions, hours_ago) -> (videos, expiry time)
+        self._videos_cache: Dict[Tuple[Optional[str], int], Tuple[Any, float]] = {}
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=MAX_API_WORKERS, thread_name_prefix='yt-api')
+        self._auth_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._rate_limited_until = 0.0
     
     def authenticate(self):
         """Authenticate with YouTube API using OAuth2"""
@@ -46,13 +169,150 @@ class YouTubeClient:
             with open(self.token_file, 'w') as token:
                 token.write(creds.to_json())
         
+        self.creds = creds
         self.youtube = build(API_SERVICE_NAME, API_VERSION, credentials=creds)
         return self.youtube
     
-    def get_subscribed_channels(self) -> List[Dict[str, str]]:
+    @property
+    def _subscriptions_cache_name(self) -> str:
+        """Name of the subscriptions cache file for the signed-in account"""
+        # The refresh token identifies the account's grant without storing it in the name
+        account_key = hashlib.sha1(self.creds.refresh_token.encode()).hexdigest()[:12]
+        return f'subscriptions-{account_key}.json'
+    
+    def _read_cache(self, name: str, max_age: Optional[float] = None) -> Any:
+        """Read a JSON cache file, or None if it is missing, unreadable or older than max_age seconds"""
+        cache_file = os.path.join(self.cache_dir, name)
+        try:
+            if max_age is not None and time.time() - os.path.getmtime(cache_file) > max_age:
+                return None
+            with open(cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache(self, name: str, data: Any):
+        """Write a JSON cache file"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cache_file = os.path.join(self.cache_dir, name)
+        # Write to a temporary file first so readers never see a partial file
+        tmp_file = f'{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    
+    def _load_video_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the per-playlist cache of recently seen uploads from disk"""
+        if self._video_cache is None:
+            self._video_cache = self._read_cache('recent_uploads.json') or {}
+            # JSON stores each VideoInfo as a plain list
+            for entry in self._video_cache.values():
+                entry['videos'] = [VideoInfo(*video) for video in entry['videos']]
+        return self._video_cache
+    
+    def _get_video_cache_entry(self, uploads_playlist_id: str) -> Optional[Dict[str, Any]]:
+        """Get the recently seen uploads of a playlist, or None if unknown or stale"""
+        entry = self._load_video_cache().get(uploads_playlist_id)
+        if entry is None or time.time() - entry.get('fetched_at', 0) > RECENT_UPLOADS_CACHE_TTL:
+            return None
+        return entry
+    
+    def _set_video_cache_entry(self, uploads_playlist_id: str, entry: Dict[str, Any]):
+        """Store a playlist's recently seen uploads, evicting the least recently updated entries"""
+        cache = self._load_video_cache()
+        # Re-insert so dict order tracks when each entry was last updated
+        cache.pop(uploads_playlist_id, None)
+        cache[uploads_playlist_id] = entry
+        while len(cache) > MAX_RECENT_UPLOADS_ENTRIES:
+            del cache[next(iter(cache))]
+        self._video_cache_dirty = True
+    
+    async def _save_video_cache(self):
+        """Write the per-playlist cache of recently seen uploads to disk if it changed"""
+        if not self._video_cache_dirty:
+            return
+        self._video_cache_dirty = False
+        # Entries are replaced rather than mutated, so a shallow copy is a stable snapshot
+        snapshot = dict(self._video_cache)
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._write_cache, 'recent_uploads.json', snapshot
+            )
+        except OSError:
+            # The cache is an optimization, so a failed write only costs API calls
+            self._video_cache_dirty = True
+    
+    def _thread_http(self) -> AuthorizedHttp:
+        """Get this worker thread's authorized Http object"""
+        # httplib2 is not thread-safe, so each thread keeps its own Http object.
+        # Reusing it across requests keeps the TLS connection alive.
+        http = getattr(self._local, 'http', None)
+        if http is None or http.credentials is not self.creds:
+            http = AuthorizedHttp(self.creds, http=httplib2.Http())
+            self._local.http = http
+        return http
+    
+    async def _ensure_authenticated(self):
+        """Authenticate in a worker thread if not done yet"""
+        # Token refresh and the OAuth flow block on network I/O
+        async with self._auth_lock:
+            if not self.youtube:
+                await asyncio.get_running_loop().run_in_executor(self._executor, self.authenticate)
+    
+    @staticmethod
+    def _is_quota_exceeded(error: HttpError) -> bool:
+        """Check whether a request failed because the daily quota is used up"""
+        return error.resp.status == 403 and b'quotaExceeded' in (error.content or b'')
+    
+    def _is_retryable(self, error: HttpError) -> bool:
+        """Check whether a failed request is worth retrying"""
+        status = error.resp.status
+        content = error.content or b''
+        
+        # The daily quota won't recover by retrying
+        if self._is_quota_exceeded(error):
+            return False
+        
+        if status == 403:
+            return any(reason in content for reason in RATE_LIMIT_REASONS)
+        return status in (429, 500, 503)
+    
+    async def _execute(self, request):
+        """Execute an API request in a worker thread without blocking the event loop"""
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            # Don't keep hammering the API after it has told us to back off
+            if self._rate_limited_until > time.time():
+                resume_at = datetime.fromtimestamp(self._rate_limited_until).strftime('%H:%M')
+                raise Exception(f"YouTube API rate limit reached, try again after {resume_at}")
+            
+            try:
+                async with self._request_semaphore:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        self._executor,
+                        lambda: request.execute(http=self._thread_http())
+                    )
+            except HttpError as e:
+                if self._is_quota_exceeded(e):
+                    self._rate_limited_until = time.time() + RATE_LIMIT_COOLDOWN
+                if not self._is_retryable(e):
+                    raise
+                
+                if attempt == MAX_REQUEST_ATTEMPTS - 1:
+                    if e.resp.status == 429:
+                        self._rate_limited_until = time.time() + RATE_LIMIT_COOLDOWN
+                    raise
+                
+                await asyncio.sleep(min(2 ** attempt + random.random(), MAX_RETRY_DELAY))
+    
+    async def get_subscribed_channels(self) -> List[Dict[str, str]]:
         """Get all channels the user is subscribed to"""
-        if not self.youtube:
-            self.authenticate()
+        # Authenticate first, since the cache file is named after the account
+        await self._ensure_authenticated()
+        
+        # Subscriptions change rarely, so serve them from disk while fresh
+        cached_channels = self._read_cache(self._subscriptions_cache_name, SUBSCRIPTIONS_CACHE_TTL)
+        if cached_channels is not None:
+            return cached_channels
             
         channels = []
         next_page_token = None
@@ -62,15 +322,16 @@ class YouTubeClient:
                 part='snippet',
                 mine=True,
                 maxResults=50,
-                pageToken=next_page_token
+                pageToken=next_page_token,
+                fields='items(snippet(title,description,resourceId/channelId)),nextPageToken'
             )
-            response = request.execute()
+            response = await self._execute(request)
             
             for item in response['items']:
                 channel_info = {
                     'channel_id': item['snippet']['resourceId']['channelId'],
                     'channel_title': item['snippet']['title'],
-                    'description': item['snippet']['description']
+                    'description': item['snippet'].get('description', '')
                 }
                 channels.append(channel_info)
             
@@ -78,84 +339,259 @@ class YouTubeClient:
             if not next_page_token:
                 break
         
+        self._write_cache(self._subscriptions_cache_name, channels)
+        
         return channels
     
-    def get_channel_latest_videos(self, channel_id: str, hours_ago: int = 24) -> List[Dict[str, Any]]:
-        """Get latest videos from a specific channel within the last X hours"""
-        if not self.youtube:
-            self.authenticate()
+    async def _get_uploads_playlists(self, channel_ids: List[str]) -> Dict[str, str]:
+        """Map channel IDs to their uploads playlist IDs, 50 channels per request"""
+        await self._ensure_authenticated()
             
-        # Calculate time threshold
-        time_threshold = datetime.utcnow() - timedelta(hours=hours_ago)
+        uploads_playlists = {}
+        unresolved_ids = []
         
-        try:
-            # Get channel's uploads playlist
-            channel_request = self.youtube.channels().list(
+        # A "UC..." channel's uploads playlist is always "UU..." with the same suffix
+        for channel_id in channel_ids:
+            if channel_id.startswith('UC'):
+                uploads_playlists[channel_id] = 'UU' + channel_id[2:]
+            else:
+                unresolved_ids.append(channel_id)
+        
+        for i in range(0, len(unresolved_ids), 50):
+            chunk = unresolved_ids[i:i + 50]
+            request = self.youtube.channels().list(
                 part='contentDetails',
-                id=channel_id
+                id=','.join(chunk),
+                maxResults=50,
+                fields='items(id,contentDetails/relatedPlaylists/uploads)'
             )
-            channel_response = channel_request.execute()
+            response = await self._execute(request)
             
-            if not channel_response['items']:
-                return []
+            for item in response.get('items', []):
+                uploads_playlists[item['id']] = item['contentDetails']['relatedPlaylists']['uploads']
+        
+        return uploads_playlists
+    
+    @staticmethod
+    def _build_video_info(item: Dict[str, Any]) -> VideoInfo:
+        """Build a VideoInfo from a playlistItems snippet"""
+        snippet = item['snippet']
+        # Field masks drop keys whose value is empty, e.g. a missing medium thumbnail
+        description = snippet.get('description', '')
+        return VideoInfo(
+            video_id=snippet['resourceId']['videoId'],
+            title=snippet['title'],
+            published_at=snippet['publishedAt'],
+            description=description[:200] + '...' if len(description) > 200 else description,
+            thumbnail=snippet.get('thumbnails', {}).get('medium', {}).get('url', '')
+        )
+    
+    def _playlist_request(self, uploads_playlist_id: str, page_token: Optional[str] = None):
+        """Build a playlistItems request for a page of a channel's uploads"""
+        # Only a few items are needed when we already know the older uploads
+        cached = self._get_video_cache_entry(uploads_playlist_id)
+        return self.youtube.playlistItems().list(
+            part='snippet',
+            playlistId=uploads_playlist_id,
+            maxResults=5 if cached else MAX_VIDEOS_PER_CHANNEL,
+            pageToken=page_token,
+            fields='items(snippet(publishedAt,title,description,resourceId/videoId,thumbnails/medium/url)),nextPageToken'
+        )
+    
+    async def _get_first_pages(self, uploads_playlist_ids: List[str]) -> Dict[str, Any]:
+        """Fetch the first page of many uploads playlists, 50 playlists per batch HTTP request"""
+        first_pages = {}
+        
+        def callback(request_id, response, exception):
+            first_pages[request_id] = exception if exception is not None else response
+        
+        batches = []
+        for i in range(0, len(uploads_playlist_ids), 50):
+            batch = self.youtube.new_batch_http_request(callback=callback)
+            for uploads_playlist_id in uploads_playlist_ids[i:i + 50]:
+                batch.add(self._playlist_request(uploads_playlist_id), request_id=uploads_playlist_id)
+            batches.append(batch)
+        
+        # Batch requests are executed just like single requests
+        await asyncio.gather(*(self._execute(batch) for batch in batches))
+        
+        return first_pages
+    
+    async def _get_playlist_videos(self, batch: VideoBatch, channel_id: str, uploads_playlist_id: str, hours_ago: int = 24, first_page: Any = None):
+        """Add videos from a channel's uploads playlist within the last X hours to batch"""
+        # Calculate time threshold. publishedAt is ISO-8601 UTC, so it can be
+        # compared as a string without parsing.
+        time_threshold = datetime.utcnow() - timedelta(hours=hours_ago)
+        time_threshold_str = time_threshold.strftime('%Y-%m-%dT%H:%M:%SZ')
+        
+        cached = self._get_video_cache_entry(uploads_playlist_id)
+        
+        try:
+            # Page through the uploads playlist (newest first) until we reach
+            # the newest video seen on the previous call
+            new_videos = []
+            reached_cached = False
+            page_token = None
             
-            uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+            while True:
+                if first_page is not None:
+                    # First page was already fetched as part of a batch
+                    playlist_response, first_page = first_page, None
+                    if isinstance(playlist_response, HttpError) and self._is_quota_exceeded(playlist_response):
+                        self._rate_limited_until = time.time() + RATE_LIMIT_COOLDOWN
+                    if isinstance(playlist_response, HttpError) and self._is_retryable(playlist_response):
+                        # Re-issue failed sub-requests on their own so they get backoff
+                        playlist_request = self._playlist_request(uploads_playlist_id)
+                        playlist_response = await self._execute(playlist_request)
+                    elif isinstance(playlist_response, Exception):
+                        raise playlist_response
+                else:
+                    playlist_request = self._playlist_request(uploads_playlist_id, page_token)
+                    playlist_response = await self._execute(playlist_request)
+                
+                for item in playlist_response['items']:
+                    if cached and item['snippet']['resourceId']['videoId'] == cached['last_video_id']:
+                        reached_cached = True
+                        break
+                    new_videos.append(self._build_video_info(item))
+                
+                page_token = playlist_response.get('nextPageToken')
+                if not cached or reached_cached or not page_token or len(new_videos) >= MAX_VIDEOS_PER_CHANNEL:
+                    break
             
-            # Get recent videos from uploads playlist
-            playlist_request = self.youtube.playlistItems().list(
-                part='snippet',
-                playlistId=uploads_playlist_id,
-                maxResults=10
-            )
-            playlist_response = playlist_request.execute()
+            if reached_cached:
+                videos = (new_videos + cached['videos'])[:MAX_VIDEOS_PER_CHANNEL]
+                # The TTL counts from the last full fetch, not from merges
+                fetched_at = cached['fetched_at']
+            else:
+                videos = new_videos[:MAX_VIDEOS_PER_CHANNEL]
+                fetched_at = time.time()
             
-            recent_videos = []
-            for item in playlist_response['items']:
-                published_at = datetime.strptime(
-                    item['snippet']['publishedAt'], 
-                    '%Y-%m-%dT%H:%M:%SZ'
-                )
-                
-                # Only include videos published within the time threshold
-                if published_at >= time_threshold:
-                    video_info = {
-                        'video_id': item['snippet']['resourceId']['videoId'],
-                        'title': item['snippet']['title'],
-                        'published_at': item['snippet']['publishedAt'],
-                        'description': item['snippet']['description'][:200] + '...' if len(item['snippet']['description']) > 200 else item['snippet']['description'],
-                        'thumbnail': item['snippet']['thumbnails'].get('medium', {}).get('url', ''),
-                        'url': f"https://www.youtube.com/watch?v={item['snippet']['resourceId']['videoId']}"
-                    }
-                    recent_videos.append(video_info)
+            # Nothing changed when the newest upload is the one seen last time
+            if new_videos:
+                self._set_video_cache_entry(uploads_playlist_id, {
+                    'last_video_id': videos[0].video_id,
+                    'fetched_at': fetched_at,
+                    'videos': videos
+                })
             
-            return recent_videos
+            # Uploads are newest first, so stop at the first video outside the time threshold
+            for video in videos:
+                if video.published_at < time_threshold_str:
+                    break
+                batch.append(video, channel_id)
             
+        except HttpError as e:
+            # Uploads playlist IDs are derived without checking the channel exists,
+            # so a missing playlist means an unknown channel with no videos
+            if e.resp.status == 404 and b'playlistNotFound' in (e.content or b''):
+                return
+            raise Exception(f"Error getting videos for channel {channel_id}: {str(e)}")
         except Exception as e:
             raise Exception(f"Error getting videos for channel {channel_id}: {str(e)}")
     
-    def get_all_latest_videos(self, hours_ago: int = 24) -> List[Dict[str, Any]]:
-        """Get latest videos from all subscribed channels"""
-        channels = self.get_subscribed_channels()
+    def _get_cached_videos(self, channel_id: Optional[str], hours_ago: int) -> Any:
+        """Look up recently fetched videos, or None if missing or expired"""
+        entry = self._videos_cache.get((channel_id, hours_ago))
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+    
+    def _sweep_videos_cache(self):
+        """Remove expired entries from the recent videos cache"""
+        now = time.time()
+        for key in [key for key, (_, expires_at) in self._videos_cache.items() if expires_at <= now]:
+            del self._videos_cache[key]
+    
+    def _cache_videos(self, channel_id: Optional[str], hours_ago: int, videos: VideoBatch):
+        """Store recently fetched videos"""
+        ttl = min(hours_ago * 60 * 60 / 2, VIDEO_RESULTS_CACHE_TTL)
+        self._videos_cache[(channel_id, hours_ago)] = (videos, time.time() + ttl)
+    
+    async def get_channel_latest_videos(self, channel_id: str, hours_ago: int = 24) -> List[Dict[str, Any]]:
+        """Get latest videos from a specific channel within the last X hours"""
+        cached_batch = self._get_cached_videos(channel_id, hours_ago)
+        if cached_batch is not None:
+            return cached_batch.to_dicts()
         
-        all_recent_videos = []
+        try:
+            # Get channel's uploads playlist
+            uploads_playlists = await self._get_uploads_playlists([channel_id])
+        except Exception as e:
+            raise Exception(f"Error getting videos for channel {channel_id}: {str(e)}")
         
-        for channel in channels:
-            recent_videos = self.get_channel_latest_videos(
-                channel['channel_id'], 
-                hours_ago
+        if channel_id not in uploads_playlists:
+            return []
+        
+        batch = VideoBatch()
+        await self._get_playlist_videos(batch, channel_id, uploads_playlists[channel_id], hours_ago)
+        await self._save_video_cache()
+        
+        self._sweep_videos_cache()
+        self._cache_videos(channel_id, hours_ago, batch)
+        
+        return batch.to_dicts()
+    
+    async def get_all_latest_videos(self, hours_ago: int = 24, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get latest videos from all subscribed channels, newest first"""
+        cached_batch = self._get_cached_videos(None, hours_ago)
+        if cached_batch is not None:
+            return cached_batch.to_dicts(limit)
+        
+        channels = await self.get_subscribed_channels()
+        
+        # Resolve all uploads playlists up front in batched requests
+        uploads_playlists = await self._get_uploads_playlists(
+            [channel['channel_id'] for channel in channels]
+        )
+        channels = [channel for channel in channels if channel['channel_id'] in uploads_playlists]
+        
+        # Fetch the first page of every uploads playlist in batched requests
+        first_pages = await self._get_first_pages(
+            [uploads_playlists[channel['channel_id']] for channel in channels]
+        )
+        
+        # Fetch any further pages concurrently (requests are bounded in _execute)
+        batch = VideoBatch()
+        self._sweep_videos_cache()
+        
+        async def fetch_channel(channel):
+            uploads_playlist_id = uploads_playlists[channel['channel_id']]
+            channel_batch = VideoBatch()
+            await self._get_playlist_videos(
+                channel_batch,
+                channel['channel_id'],
+                uploads_playlist_id,
+                hours_ago,
+                first_page=first_pages.get(uploads_playlist_id)
             )
             
-            for video in recent_videos:
-                video['channel_title'] = channel['channel_title']
-                all_recent_videos.append(video)
-        
-        # Sort by published date (newest first)
-        all_recent_videos.sort(
-            key=lambda x: datetime.strptime(x['published_at'], '%Y-%m-%dT%H:%M:%SZ'),
-            reverse=True
-        )
+            # Follow-up get_channel_videos calls can reuse this channel's result
+            self._cache_videos(channel['channel_id'], hours_ago, channel_batch)
+            
+            # Interned so every video from a channel shares one title string
+            batch.extend(channel_batch, sys.intern(channel['channel_title']))
+        
+        tasks = [asyncio.create_task(fetch_channel(channel)) for channel in channels]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        await self._save_video_cache()
+        
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
         
-        return all_recent_videos
+        batch.sort_newest_first()
+        self._cache_videos(None, hours_ago, batch)
+        
+        # Only build dicts for the videos that will be returned
+        return batch.to_dicts(limit)
+
+def to_json(data: Any) -> str:
+    """Serialize tool results as indented JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
 
 # Initialize YouTube client
 youtube_client = YouTubeClient()
@@ -164,101 +600,110 @@ youtube_client = YouTubeClient()
 mcp = FastMCP("YouTube Latest Videos",request_timeout=300) # 5 minutes
 
 @mcp.tool()
-def get_latest_youtube_videos(hours_ago: int = 24, limit: int = 50) -> str:
+async def get_latest_youtube_videos(hours_ago: int = 24, limit: int = 50, include_json: bool = False) -> str:
     """Get the latest videos from all YouTube channels you're subscribed to.
     
     Args:
         hours_ago: Number of hours to look back for new videos (default: 24)
         limit: Maximum number of videos to return (default: 50)
+        include_json: Also return the results as JSON data (default: False)
     """
     try:
-        videos = youtube_client.get_all_latest_videos(hours_ago)
-        
-        # Apply limit
-        if limit and len(videos) > limit:
-            videos = videos[:limit]
+        videos = await youtube_client.get_all_latest_videos(hours_ago, limit)
         
         if not videos:
             return f"No new videos found in the last {hours_ago} hours from your subscribed channels."
         
         # Format the response
-        result = {
-            "total_videos": len(videos),
-            "hours_checked": hours_ago,
-            "videos": videos
-        }
-        
-        response_text = f"Found {len(videos)} new videos in the last {hours_ago} hours:\n\n"
+        parts = [f"Found {len(videos)} new videos in the last {hours_ago} hours:\n\n"]
         
         for video in videos:
-            published_utc = datetime.strptime(video['published_at'], '%Y-%m-%dT%H:%M:%SZ')
-            published_local = published_utc.strftime('%Y-%m-%d %H:%M UTC')
+            # published_at is always 'YYYY-MM-DDTHH:MM:SSZ', so slice instead of parsing
+            published_local = f"{video['published_at'][:10]} {video['published_at'][11:16]} UTC"
             
-            response_text += f"📺 **{video['channel_title']}**\n"
-            response_text += f"🎬 {video['title']}\n"
-            response_text += f"🕒 {published_local}\n"
-            response_text += f"🔗 {video['url']}\n"
-            if video['description']:
-                response_text += f"📝 {video['description']}\n"
-            response_text += "\n" + "-" * 50 + "\n\n"
+            desc_line = f"📝 {video['description']}\n" if video['description'] else ""
+            
+            parts.append(
+                f"📺 **{video['channel_title']}**\n"
+                f"🎬 {video['title']}\n"
+                f"🕒 {published_local}\n"
+                f"🔗 {WATCH_URL_PREFIX}{video['video_id']}\n"
+                f"{desc_line}{VIDEO_SEPARATOR}"
+            )
+        
+        if include_json:
+            result = {
+                "total_videos": len(videos),
+                "hours_checked": hours_ago,
+                "videos": videos
+            }
+            parts.append(f"\nJSON Data:\n```json\n{to_json(result)}\n```")
         
-        response_text += f"\nJSON Data:\n```json\n{json.dumps(result, indent=2)}\n```"
-        return response_text
+        return "".join(parts)
         
     except Exception as e:
         return f"Error getting latest YouTube videos: {str(e)}"
 
 @mcp.tool()
-def get_subscribed_channels() -> str:
-    """Get a list of all YouTube channels you're subscribed to."""
+async def get_subscribed_channels(include_json: bool = False) -> str:
+    """Get a list of all YouTube channels you're subscribed to.
+    
+    Args:
+        include_json: Also return the results as JSON data (default: False)
+    """
     try:
-        channels = youtube_client.get_subscribed_channels()
+        channels = await youtube_client.get_subscribed_channels()
         
-        response_text = f"You are subscribed to {len(channels)} channels:\n\n"
+        parts = [f"You are subscribed to {len(channels)} channels:\n\n"]
         
         for channel in channels:
-            response_text += f"📺 **{channel['channel_title']}**\n"
-            response_text += f"🆔 {channel['channel_id']}\n"
+            parts.append(f"📺 **{channel['channel_title']}**\n")
+            parts.append(f"🆔 {channel['channel_id']}\n")
             if channel['description']:
                 desc = channel['description'][:100] + '...' if len(channel['description']) > 100 else channel['description']
-                response_text += f"📝 {desc}\n"
-            response_text += "\n"
+                parts.append(f"📝 {desc}\n")
+            parts.append("\n")
         
-        response_text += f"\nJSON Data:\n```json\n{json.dumps(channels, indent=2)}\n```"
-        return response_text
+        if include_json:
+            parts.append(f"\nJSON Data:\n```json\n{to_json(channels)}\n```")
+        return "".join(parts)
         
     except Exception as e:
         return f"Error getting subscribed channels: {str(e)}"
 
 @mcp.tool()
-def get_channel_videos(channel_id: str, hours_ago: int = 24) -> str:
+async def get_channel_videos(channel_id: str, hours_ago: int = 24, include_json: bool = False) -> str:
     """Get latest videos from a specific YouTube channel.
     
     Args:
         channel_id: The YouTube channel ID
         hours_ago: Number of hours to look back for new videos (default: 24)
+        include_json: Also return the results as JSON data (default: False)
     """
     try:
-        videos = youtube_client.get_channel_latest_videos(channel_id, hours_ago)
+        videos = await youtube_client.get_channel_latest_videos(channel_id, hours_ago)
         
         if not videos:
             return f"No new videos found in the last {hours_ago} hours for channel {channel_id}."
         
-        response_text = f"Found {len(videos)} new videos in the last {hours_ago} hours:\n\n"
+        parts = [f"Found {len(videos)} new videos in the last {hours_ago} hours:\n\n"]
         
         for video in videos:
-            published_utc = datetime.strptime(video['published_at'], '%Y-%m-%dT%H:%M:%SZ')
-            published_local = published_utc.strftime('%Y-%m-%d %H:%M UTC')
+            # published_at is always 'YYYY-MM-DDTHH:MM:SSZ', so slice instead of parsing
+            published_local = f"{video['published_at'][:10]} {video['published_at'][11:16]} UTC"
             
-            response_text += f"🎬 {video['title']}\n"
-            response_text += f"🕒 {published_local}\n"
-            response_text += f"🔗 {video['url']}\n"
-            if video['description']:
-                response_text += f"📝 {video['description']}\n"
-            response_text += "\n" + "-" * 50 + "\n\n"
-        
-        response_text += f"\nJSON Data:\n```json\n{json.dumps(videos, indent=2)}\n```"
-        return response_text
+            desc_line = f"📝 {video['description']}\n" if video['description'] else ""
+            
+            parts.append(
+                f"🎬 {video['title']}\n"
+                f"🕒 {published_local}\n"
+                f"🔗 {WATCH_URL_PREFIX}{video['video_id']}\n"
+                f"{desc_line}{VIDEO_SEPARATOR}"
+            )
+        
+        if include_json:
+            parts.append(f"\nJSON Data:\n```json\n{to_json(videos)}\n```")
+        return "".join(parts)
         
     except Exception as e:
         return f"Error getting channel videos: {str(e)}"